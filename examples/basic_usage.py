@@ -188,6 +188,20 @@ def compact_vs_pretty():
     print(page.render(pretty=True))
 
 
+@memoize(maxsize=256)
+def product_card(name, price, in_stock):
+    """A product card, built and serialized once per unique set of props."""
+    stock_status = "In Stock" if in_stock else "Out of Stock"
+    stock_class = "stock-available" if in_stock else "stock-unavailable"
+
+    return Div(
+        H3(name),
+        Paragraph(f"${price:.2f}"),
+        Span(stock_status, class_name=stock_class),
+        class_name="product-card",
+    )
+
+
 def dynamic_content():
     """Building HTML dynamically based on data."""
     print("\n=== Dynamic Content ===\n")
@@ -199,20 +213,12 @@ def dynamic_content():
         {"name": "Keyboard", "price": 79.99, "in_stock": False},
     ]
 
-    # Build product cards dynamically
-    product_list = Div(class_name="products")
-
-    for product in products:
-        stock_status = "In Stock" if product["in_stock"] else "Out of Stock"
-        stock_class = "stock-available" if product["in_stock"] else "stock-unavailable"
-
-        card = Div(
-            H3(product["name"]),
-            Paragraph(f"${product['price']:.2f}"),
-            Span(stock_status, class_name=stock_class),
-            class_name="product-card",
-        )
-        product_list.append(card)
+    # Build product cards dynamically; identical products reuse one
+    # cached card. extend() adds every item of an iterable in one call.
+    product_list = Div(class_name="products").extend(
+        product_card(product["name"], product["price"], product["in_stock"])
+        for product in products
+    )
 
     print(product_list.render(pretty=True))
 
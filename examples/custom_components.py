@@ -9,15 +9,20 @@ by subclassing HTMLElement:
 - Building a component library
 """
 
+from functools import lru_cache
+from itertools import product
+
 from nitro_ui import *
 
 
 class Card(HTMLElement):
     """A reusable card component."""
 
+    __slots__ = []
+
     def __init__(self, title, *children, **kwargs):
-        super().__init__(*children, **{**kwargs, "tag": "div"})
-        self.add_attribute("class", "card")
+        kwargs["class_name"] = "card"
+        super().__init__(*children, tag="div", **kwargs)
         self.add_styles(
             {
                 "background": "white",
@@ -37,15 +42,15 @@ class Card(HTMLElement):
         # Wrap existing children in body
         if children:
             body = Div(class_name="card-body").add_style("padding", "16px")
-            for child in children:
-                if isinstance(child, HTMLElement):
-                    body.append(child)
+            body.extend(child for child in children if isinstance(child, HTMLElement))
             self.append(body)
 
 
 class Alert(HTMLElement):
     """A configurable alert component."""
 
+    __slots__ = []
+
     VARIANTS = {
         "info": {"bg": "#cce5ff", "border": "#b8daff", "text": "#004085"},
         "success": {"bg": "#d4edda", "border": "#c3e6cb", "text": "#155724"},
@@ -53,23 +58,26 @@ class Alert(HTMLElement):
         "danger": {"bg": "#f8d7da", "border": "#f5c6cb", "text": "#721c24"},
     }
 
+    # Style dict per variant, built once instead of on every instance
+    STYLES = {
+        variant: {
+            "background-color": colors["bg"],
+            "border": f"1px solid {colors['border']}",
+            "color": colors["text"],
+            "padding": "12px 16px",
+            "border-radius": "4px",
+            "margin-bottom": "16px",
+        }
+        for variant, colors in VARIANTS.items()
+    }
+
     def __init__(self, message, variant="info", dismissible=False, **kwargs):
-        super().__init__(**{**kwargs, "tag": "div"})
+        super().__init__(tag="div", **kwargs)
 
         colors = self.VARIANTS.get(variant, self.VARIANTS["info"])
 
         self.add_attributes([("class", f"alert alert-{variant}"), ("role", "alert")])
-
-        self.add_styles(
-            {
-                "background-color": colors["bg"],
-                "border": f"1px solid {colors['border']}",
-                "color": colors["text"],
-                "padding": "12px 16px",
-                "border-radius": "4px",
-                "margin-bottom": "16px",
-            }
-        )
+        self.add_styles(self.STYLES.get(variant, self.STYLES["info"]))
 
         self.append(Span(message))
 
@@ -92,88 +100,92 @@ class Alert(HTMLElement):
 class Badge(HTMLElement):
     """A badge/tag component."""
 
-    def __init__(self, text, variant="default", pill=False, **kwargs):
-        super().__init__(text, **{**kwargs, "tag": "span"})
-
-        colors = {
-            "default": {"bg": "#6c757d", "text": "white"},
-            "primary": {"bg": "#007bff", "text": "white"},
-            "success": {"bg": "#28a745", "text": "white"},
-            "danger": {"bg": "#dc3545", "text": "white"},
-            "warning": {"bg": "#ffc107", "text": "#212529"},
+    __slots__ = []
+
+    COLORS = {
+        "default": {"bg": "#6c757d", "text": "white"},
+        "primary": {"bg": "#007bff", "text": "white"},
+        "success": {"bg": "#28a745", "text": "white"},
+        "danger": {"bg": "#dc3545", "text": "white"},
+        "warning": {"bg": "#ffc107", "text": "#212529"},
+    }
+
+    # Style dict per (variant, pill), built once instead of on every instance
+    STYLES = {
+        (variant, pill): {
+            "display": "inline-block",
+            "padding": "4px 8px",
+            "font-size": "12px",
+            "font-weight": "600",
+            "background-color": color["bg"],
+            "color": color["text"],
+            "border-radius": "999px" if pill else "4px",
         }
+        for variant, color in COLORS.items()
+        for pill in (False, True)
+    }
+
+    def __init__(self, text, variant="default", pill=False, **kwargs):
+        kwargs["class_name"] = f"badge badge-{variant}"
+        super().__init__(text, tag="span", **kwargs)
 
-        color = colors.get(variant, colors["default"])
+        variant_key = variant if variant in self.COLORS else "default"
 
-        self.add_attribute("class", f"badge badge-{variant}")
-        self.add_styles(
-            {
-                "display": "inline-block",
-                "padding": "4px 8px",
-                "font-size": "12px",
-                "font-weight": "600",
-                "background-color": color["bg"],
-                "color": color["text"],
-                "border-radius": "999px" if pill else "4px",
-            }
-        )
+        self.add_styles(self.STYLES[variant_key, bool(pill)])
 
 
 class Button(HTMLElement):
     """An enhanced button component."""
 
-    def __init__(self, text, variant="primary", size="md", outline=False, **kwargs):
-        super().__init__(text, **{**kwargs, "tag": "button"})
+    __slots__ = []
 
-        colors = {
-            "primary": "#007bff",
-            "secondary": "#6c757d",
-            "success": "#28a745",
-            "danger": "#dc3545",
-        }
+    COLORS = {
+        "primary": "#007bff",
+        "secondary": "#6c757d",
+        "success": "#28a745",
+        "danger": "#dc3545",
+    }
 
-        sizes = {
-            "sm": {"padding": "6px 12px", "font-size": "14px"},
-            "md": {"padding": "10px 20px", "font-size": "16px"},
-            "lg": {"padding": "14px 28px", "font-size": "18px"},
+    SIZES = {
+        "sm": {"padding": "6px 12px", "font-size": "14px"},
+        "md": {"padding": "10px 20px", "font-size": "16px"},
+        "lg": {"padding": "14px 28px", "font-size": "18px"},
+    }
+
+    # Style dict per (variant, size, outline), built once instead of on
+    # every instance
+    STYLES = {
+        (variant, size, outline): {
+            "background-color": "transparent" if outline else color,
+            "border": f"2px solid {color}" if outline else "none",
+            "color": color if outline else "white",
+            **size_styles,
+            "border-radius": "4px",
+            "cursor": "pointer",
+            "font-weight": "600",
         }
+        for (variant, color), (size, size_styles), outline in product(
+            COLORS.items(), SIZES.items(), (False, True)
+        )
+    }
 
-        color = colors.get(variant, colors["primary"])
-        size_styles = sizes.get(size, sizes["md"])
+    def __init__(self, text, variant="primary", size="md", outline=False, **kwargs):
+        kwargs["class_name"] = f"btn btn-{variant}"
+        super().__init__(text, tag="button", **kwargs)
 
-        self.add_attribute("class", f"btn btn-{variant}")
+        variant_key = variant if variant in self.COLORS else "primary"
+        size_key = size if size in self.SIZES else "md"
 
-        if outline:
-            self.add_styles(
-                {
-                    "background-color": "transparent",
-                    "border": f"2px solid {color}",
-                    "color": color,
-                    **size_styles,
-                    "border-radius": "4px",
-                    "cursor": "pointer",
-                    "font-weight": "600",
-                }
-            )
-        else:
-            self.add_styles(
-                {
-                    "background-color": color,
-                    "border": "none",
-                    "color": "white",
-                    **size_styles,
-                    "border-radius": "4px",
-                    "cursor": "pointer",
-                    "font-weight": "600",
-                }
-            )
+        self.add_styles(self.STYLES[variant_key, size_key, bool(outline)])
 
 
 class Modal(HTMLElement):
     """A modal dialog component."""
 
+    __slots__ = []
+
     def __init__(self, title, *children, modal_id="modal", **kwargs):
-        super().__init__(**{**kwargs, "tag": "div"})
+        super().__init__(tag="div", **kwargs)
 
         self.add_attributes(
             [
@@ -199,18 +211,6 @@ class Modal(HTMLElement):
             }
         )
 
-        # Modal content container
-        content = Div(class_name="modal-content").add_styles(
-            {
-                "background": "white",
-                "border-radius": "8px",
-                "max-width": "500px",
-                "width": "100%",
-                "max-height": "90vh",
-                "overflow": "auto",
-            }
-        )
-
         # Header
         header = Div(
             H2(title, id=f"{modal_id}-title"), class_name="modal-header"
@@ -223,35 +223,37 @@ class Modal(HTMLElement):
                 "align-items": "center",
             }
         )
-        content.append(header)
 
         # Body
         body = Div(*children, class_name="modal-body").add_styles({"padding": "20px"})
-        content.append(body)
 
-        self.append(content)
+        # Modal content container, built with its children in one call
+        self.append(
+            Div(header, body, class_name="modal-content").add_styles(
+                {
+                    "background": "white",
+                    "border-radius": "8px",
+                    "max-width": "500px",
+                    "width": "100%",
+                    "max-height": "90vh",
+                    "overflow": "auto",
+                }
+            )
+        )
 
 
 class Avatar(HTMLElement):
     """An avatar component for user profiles."""
 
+    __slots__ = []
+
+    COLORS = ("#007bff", "#28a745", "#dc3545", "#ffc107", "#17a2b8", "#6f42c1")
+
     def __init__(self, src=None, name=None, size=40, **kwargs):
-        super().__init__(**{**kwargs, "tag": "div"})
+        kwargs["class_name"] = "avatar"
+        super().__init__(tag="div", **kwargs)
 
-        self.add_attribute("class", "avatar")
-        self.add_styles(
-            {
-                "width": f"{size}px",
-                "height": f"{size}px",
-                "border-radius": "50%",
-                "overflow": "hidden",
-                "display": "flex",
-                "align-items": "center",
-                "justify-content": "center",
-                "font-weight": "600",
-                "font-size": f"{size // 2}px",
-            }
-        )
+        self.add_styles(self._size_styles(size))
 
         if src:
             self.append(
@@ -261,29 +263,46 @@ class Avatar(HTMLElement):
             )
         elif name:
             # Generate initials and background color
-            initials = "".join(word[0].upper() for word in name.split()[:2])
+            initials = "".join([word[0] for word in name.split(None, 2)[:2]]).upper()
             bg_color = self._generate_color(name)
             self.add_styles({"background-color": bg_color, "color": "white"})
             self.text = initials
 
     @staticmethod
-    def _generate_color(name):
+    @lru_cache(maxsize=16)
+    def _size_styles(size):
+        """Base styles for one avatar size; apps use only a handful of sizes."""
+        return {
+            "width": f"{size}px",
+            "height": f"{size}px",
+            "border-radius": "50%",
+            "overflow": "hidden",
+            "display": "flex",
+            "align-items": "center",
+            "justify-content": "center",
+            "font-weight": "600",
+            "font-size": f"{size // 2}px",
+        }
+
+    @classmethod
+    def _generate_color(cls, name):
         """Generate a consistent color from a name."""
-        colors = ["#007bff", "#28a745", "#dc3545", "#ffc107", "#17a2b8", "#6f42c1"]
-        return colors[sum(ord(c) for c in name) % len(colors)]
+        return cls.COLORS[sum(map(ord, name)) % len(cls.COLORS)]
 
 
 class NavItem(HTMLElement):
     """A navigation item component."""
 
-    def __init__(self, text, href="#", active=False, **kwargs):
-        super().__init__(**{**kwargs, "tag": "li"})
+    __slots__ = []
 
-        self.add_attribute("class", "nav-item")
+    def __init__(self, text, href="#", active=False, **kwargs):
+        kwargs["class_name"] = "nav-item"
+        super().__init__(tag="li", **kwargs)
 
-        link = Anchor(text, href=href, class_name="nav-link")
+        link = Anchor(
+            text, href=href, class_name="nav-link active" if active else "nav-link"
+        )
         if active:
-            link.add_attribute("class", "nav-link active")
             link.add_style("font-weight", "600")
 
         self.append(link)
@@ -292,10 +311,12 @@ class NavItem(HTMLElement):
 class Navbar(HTMLElement):
     """A navigation bar component."""
 
+    __slots__ = []
+
     def __init__(self, brand, *items, **kwargs):
-        super().__init__(**{**kwargs, "tag": "nav"})
+        kwargs["class_name"] = "navbar"
+        super().__init__(tag="nav", **kwargs)
 
-        self.add_attribute("class", "navbar")
         self.add_styles(
             {
                 "display": "flex",
@@ -337,29 +358,40 @@ class Navbar(HTMLElement):
 
 
 class WithLifecycleHooks(HTMLElement):
-    """Component demonstrating lifecycle hooks."""
+    """Component demonstrating lifecycle hooks.
+
+    Hook logging is off by default so the hooks cost only a flag check
+    during rendering; pass ``debug=True`` to trace them.
+    """
+
+    __slots__ = ["component_name", "debug"]
 
-    def __init__(self, name, **kwargs):
+    def __init__(self, name, debug=False, **kwargs):
         self.component_name = name
-        super().__init__(**{**kwargs, "tag": "div"})
-        self.add_attribute("class", "lifecycle-component")
+        self.debug = debug
+        kwargs["class_name"] = "lifecycle-component"
+        super().__init__(tag="div", **kwargs)
 
     def on_load(self):
         """Called when the component is instantiated."""
-        print(f"[{self.component_name}] on_load: Component initialized")
+        if self.debug:
+            print(f"[{self.component_name}] on_load: Component initialized")
         self.append(Paragraph("Component loaded"))
 
     def on_before_render(self):
         """Called before rendering."""
-        print(f"[{self.component_name}] on_before_render: About to render")
+        if self.debug:
+            print(f"[{self.component_name}] on_before_render: About to render")
 
     def on_after_render(self):
         """Called after rendering."""
-        print(f"[{self.component_name}] on_after_render: Rendering complete")
+        if self.debug:
+            print(f"[{self.component_name}] on_after_render: Rendering complete")
 
     def on_unload(self):
         """Called when the component is garbage collected."""
-        print(f"[{self.component_name}] on_unload: Component destroyed")
+        if self.debug:
+            print(f"[{self.component_name}] on_unload: Component destroyed")
 
 
 def basic_custom_components():
@@ -499,7 +531,7 @@ def lifecycle_hooks_demo():
     """Demonstrating lifecycle hooks."""
     print("\n=== Lifecycle Hooks Demo ===\n")
 
-    component = WithLifecycleHooks("MyComponent")
+    component = WithLifecycleHooks("MyComponent", debug=True)
     print("\nRendering component:")
     html = component.render()
     print(f"\nOutput: {html}")
@@ -7,10 +7,17 @@ This module demonstrates building HTML forms:
 - Fieldsets and legends
 - Form validation attributes
 - Complex form layouts
+- Streaming output with render_to()
 """
 
+import sys
+
 from nitro_ui import *
 
+# Identical in every form below, so built and rendered once and shared.
+# Frozen elements must not be mutated: the change would show up everywhere.
+SUBMIT_BUTTON = Button("Submit", type="submit").freeze()
+
 
 def basic_form():
     """Basic form with common elements."""
@@ -33,7 +40,7 @@ def basic_form():
             class_name="form-group",
         ),
         Div(
-            Button("Submit", type="submit"),
+            SUBMIT_BUTTON,
             Button("Reset", type="reset"),
             class_name="form-actions",
         ),
@@ -41,7 +48,8 @@ def basic_form():
         method="post",
     )
 
-    print(form.render(pretty=True))
+    form.render_to(sys.stdout, pretty=True)
+    print()
 
 
 def input_types():
@@ -152,12 +160,13 @@ def input_types():
                 Input(type="hidden", name="csrf_token", value="abc123"),
             ),
         ),
-        Button("Submit", type="submit"),
+        SUBMIT_BUTTON,
         action="/submit",
         method="post",
     )
 
-    print(form.render(pretty=True))
+    form.render_to(sys.stdout, pretty=True)
+    print()
 
 
 def checkbox_and_radio():
@@ -209,12 +218,31 @@ def checkbox_and_radio():
                 Label("Premium - $19.99/month", for_element="premium"),
             ),
         ),
-        Button("Submit", type="submit"),
+        SUBMIT_BUTTON,
         action="/preferences",
         method="post",
     )
 
-    print(form.render(pretty=True))
+    form.render_to(sys.stdout, pretty=True)
+    print()
+
+
+# (value, label) pairs for the select examples
+COUNTRIES = (
+    ("", "Select a country..."),
+    ("us", "United States"),
+    ("uk", "United Kingdom"),
+    ("ca", "Canada"),
+    ("au", "Australia"),
+)
+
+SKILLS = (
+    ("python", "Python"),
+    ("js", "JavaScript"),
+    ("go", "Go"),
+    ("rust", "Rust"),
+    ("java", "Java"),
+)
 
 
 def select_elements():
@@ -226,11 +254,7 @@ def select_elements():
         Div(
             Label("Country:", for_element="country"),
             Select(
-                Option("Select a country...", value=""),
-                Option("United States", value="us"),
-                Option("United Kingdom", value="uk"),
-                Option("Canada", value="ca"),
-                Option("Australia", value="au"),
+                *[Option(label, value=value) for value, label in COUNTRIES],
                 id="country",
                 name="country",
                 required="true",
@@ -266,11 +290,7 @@ def select_elements():
         Div(
             Label("Skills (select multiple):", for_element="skills"),
             Select(
-                Option("Python", value="python"),
-                Option("JavaScript", value="js"),
-                Option("Go", value="go"),
-                Option("Rust", value="rust"),
-                Option("Java", value="java"),
+                *[Option(label, value=value) for value, label in SKILLS],
                 id="skills",
                 name="skills",
                 multiple="true",
@@ -278,12 +298,13 @@ def select_elements():
             ),
             class_name="form-group",
         ),
-        Button("Submit", type="submit"),
+        SUBMIT_BUTTON,
         action="/submit",
         method="post",
     )
 
-    print(form.render(pretty=True))
+    form.render_to(sys.stdout, pretty=True)
+    print()
 
 
 def textarea_element():
@@ -316,12 +337,13 @@ def textarea_element():
             Small("Maximum 500 characters"),
             class_name="form-group",
         ),
-        Button("Submit", type="submit"),
+        SUBMIT_BUTTON,
         action="/feedback",
         method="post",
     )
 
-    print(form.render(pretty=True))
+    form.render_to(sys.stdout, pretty=True)
+    print()
 
 
 def form_validation():
@@ -378,13 +400,14 @@ def form_validation():
             Label("I agree to the terms and conditions", for_element="agree"),
             class_name="form-group",
         ),
-        Button("Submit", type="submit"),
+        SUBMIT_BUTTON,
         action="/register",
         method="post",
         novalidate="false",  # Enable HTML5 validation
     )
 
-    print(form.render(pretty=True))
+    form.render_to(sys.stdout, pretty=True)
+    print()
 
 
 def progress_and_meter():
@@ -455,7 +478,8 @@ def progress_and_meter():
         ),
     )
 
-    print(content.render(pretty=True))
+    content.render_to(sys.stdout, pretty=True)
+    print()
 
 
 def output_element():
@@ -479,7 +503,8 @@ def output_element():
         oninput="result.value=parseInt(a.value)+parseInt(b.value)",
     )
 
-    print(form.render(pretty=True))
+    form.render_to(sys.stdout, pretty=True)
+    print()
 
 
 def datalist_element():
@@ -529,12 +554,13 @@ def datalist_element():
             ),
             class_name="form-group",
         ),
-        Button("Submit", type="submit"),
+        SUBMIT_BUTTON,
         action="/submit",
         method="post",
     )
 
-    print(form.render(pretty=True))
+    form.render_to(sys.stdout, pretty=True)
+    print()
 
 
 def complex_form():
@@ -673,66 +699,78 @@ def complex_form():
         enctype="multipart/form-data",
     )
 
-    print(form.render(pretty=True))
+    form.render_to(sys.stdout, pretty=True)
+    print()
 
 
-def dynamic_form():
-    """Building forms dynamically."""
-    print("\n=== Dynamic Form ===\n")
+# Form fields defined as data, shared by every call to dynamic_form()
+DYNAMIC_FIELDS = (
+    {"name": "username", "type": "text", "label": "Username", "required": True},
+    {"name": "email", "type": "email", "label": "Email", "required": True},
+    {"name": "age", "type": "number", "label": "Age", "min": 18, "max": 120},
+    {"name": "bio", "type": "textarea", "label": "Bio", "rows": 4},
+    {"name": "newsletter", "type": "checkbox", "label": "Subscribe to newsletter"},
+)
 
-    # Define form fields as data
-    fields = [
-        {"name": "username", "type": "text", "label": "Username", "required": True},
-        {"name": "email", "type": "email", "label": "Email", "required": True},
-        {"name": "age", "type": "number", "label": "Age", "min": 18, "max": 120},
-        {"name": "bio", "type": "textarea", "label": "Bio", "rows": 4},
-        {"name": "newsletter", "type": "checkbox", "label": "Subscribe to newsletter"},
-    ]
-
-    def build_field(field):
-        """Build a form field from a dictionary definition."""
-        field_id = f"field-{field['name']}"
-
-        if field["type"] == "textarea":
-            input_el = Textarea(
-                id=field_id, name=field["name"], rows=str(field.get("rows", 4))
-            )
-        elif field["type"] == "checkbox":
-            return Div(
-                Input(type="checkbox", id=field_id, name=field["name"]),
-                Label(field["label"], for_element=field_id),
-                class_name="form-group checkbox-group",
-            )
-        else:
-            attrs = {"type": field["type"], "id": field_id, "name": field["name"]}
-            if field.get("required"):
-                attrs["required"] = "true"
-            if "min" in field:
-                attrs["min"] = str(field["min"])
-            if "max" in field:
-                attrs["max"] = str(field["max"])
-
-            input_el = Input(**attrs)
 
+def build_field(field):
+    """Build a form field from a dictionary definition."""
+    field_id = f"field-{field['name']}"
+
+    if field["type"] == "textarea":
+        input_el = Textarea(
+            id=field_id, name=field["name"], rows=str(field.get("rows", 4))
+        )
+    elif field["type"] == "checkbox":
         return Div(
-            Label(f"{field['label']}:", for_element=field_id),
-            input_el,
-            class_name="form-group",
+            Input(type="checkbox", id=field_id, name=field["name"]),
+            Label(field["label"], for_element=field_id),
+            class_name="form-group checkbox-group",
         )
+    else:
+        attrs = {"type": field["type"], "id": field_id, "name": field["name"]}
+        if field.get("required"):
+            attrs["required"] = "true"
+        if "min" in field:
+            attrs["min"] = str(field["min"])
+        if "max" in field:
+            attrs["max"] = str(field["max"])
+
+        input_el = Input(**attrs)
+
+    return Div(
+        Label(f"{field['label']}:", for_element=field_id),
+        input_el,
+        class_name="form-group",
+    )
 
-    # Build form dynamically
-    form = Form(
+
+@memoize
+def dynamic_form_tree():
+    """The dynamic form, built from DYNAMIC_FIELDS once and then reused."""
+    return Form(
         H2("Dynamic Form"),
-        *[build_field(f) for f in fields],
-        Button("Submit", type="submit"),
+        *[build_field(f) for f in DYNAMIC_FIELDS],
+        SUBMIT_BUTTON,
         action="/submit",
         method="post",
     )
 
-    print(form.render(pretty=True))
+
+def dynamic_form():
+    """Building forms dynamically."""
+    print("\n=== Dynamic Form ===\n")
+
+    dynamic_form_tree().render_to(sys.stdout, pretty=True)
+    print()
 
 
 if __name__ == "__main__":
+    # render_to() makes many small writes; on a terminal stdout would
+    # otherwise flush at every newline. Output is flushed at exit.
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+
     basic_form()
     input_types()
     checkbox_and_radio()
@@ -53,13 +53,17 @@ def conditional_rendering():
 
     def render_user_info(user, show_details=False):
         """Render user info, optionally with details."""
-        content = Fragment()
-        content.append(H2(user["name"]))
+        content = Fragment(H2(user["name"]))
 
         if show_details:
-            content.append(Paragraph(f"Email: {user['email']}"))
-            content.append(Paragraph(f"Role: {user['role']}"))
-            content.append(Paragraph(f"Status: {user['status']}"))
+            content.extend(
+                Paragraph(f"{label}: {user[key]}")
+                for label, key in (
+                    ("Email", "email"),
+                    ("Role", "role"),
+                    ("Status", "status"),
+                )
+            )
         else:
             content.append(Paragraph("Click to view details"))
 
@@ -132,10 +136,7 @@ def list_composition():
         if show_count:
             fragment.append(Paragraph(f"Total: {len(items)} items"))
 
-        for item in items:
-            fragment.append(ListItem(item))
-
-        return fragment
+        return fragment.extend(map(ListItem, items))
 
     items = ["Apple", "Banana", "Cherry", "Date", "Elderberry"]
 
@@ -152,15 +153,15 @@ def table_rows_fragment():
 
     def render_product_rows(products):
         """Render table rows for products."""
-        fragment = Fragment()
-        for product in products:
-            row = TableRow(
+
+        def product_row(product):
+            return TableRow(
                 TableDataCell(product["name"]),
                 TableDataCell(f"${product['price']:.2f}"),
                 TableDataCell(product["stock"]),
             )
-            fragment.append(row)
-        return fragment
+
+        return Fragment().extend(map(product_row, products))
 
     products = [
         {"name": "Widget", "price": 9.99, "stock": "In Stock"},
@@ -16,48 +16,61 @@ from nitro_ui import *
 # =============================================================================
 
 
-def base_layout(title, *content):
-    """Shared base layout for all frameworks."""
-    return HTML(
-        Head(
-            Title(title),
-            Meta(charset="utf-8"),
-            Meta(name="viewport", content="width=device-width, initial-scale=1.0"),
-            Link(rel="stylesheet", href="/static/styles.css"),
-            Style(
-                """
+# The static parts of the layout are the same on every request, so they are
+# built once at import and frozen: their HTML is rendered once and reused.
+LAYOUT_ASSETS = Fragment(
+    Meta(charset="utf-8"),
+    Meta(name="viewport", content="width=device-width, initial-scale=1.0"),
+    Link(rel="stylesheet", href="/static/styles.css"),
+    Style(
+        """
                 body { font-family: system-ui, sans-serif; margin: 0; padding: 0; }
                 .container { max-width: 1200px; margin: 0 auto; padding: 20px; }
                 .nav { background: #333; padding: 10px 20px; }
                 .nav a { color: white; margin-right: 20px; text-decoration: none; }
                 .card { background: white; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); padding: 20px; margin: 10px 0; }
             """
-            ),
-        ),
+    ),
+).freeze()
+
+LAYOUT_NAV = Nav(
+    Anchor("Home", href="/", class_name="nav-link"),
+    Anchor("Users", href="/users", class_name="nav-link"),
+    Anchor("API", href="/api/status", class_name="nav-link"),
+    class_name="nav",
+).freeze()
+
+LAYOUT_FOOTER = Footer(Paragraph("Powered by NitroUI"), class_name="container").freeze()
+
+
+def base_layout(title, *content):
+    """Shared base layout for all frameworks."""
+    return HTML(
+        Head(Title(title), LAYOUT_ASSETS),
         Body(
-            Nav(
-                Anchor("Home", href="/", class_name="nav-link"),
-                Anchor("Users", href="/users", class_name="nav-link"),
-                Anchor("API", href="/api/status", class_name="nav-link"),
-                class_name="nav",
-            ),
+            LAYOUT_NAV,
             Main(Div(*content, class_name="container")),
-            Footer(Paragraph("Powered by NitroUI"), class_name="container"),
+            LAYOUT_FOOTER,
         ),
     )
 
 
-def user_card(user):
-    """Reusable user card component."""
+@memoize(maxsize=4096)
+def _user_card(user_id, name, email, role):
     return Div(
-        H3(user["name"]),
-        Paragraph(f"Email: {user['email']}"),
-        Paragraph(f"Role: {user['role']}"),
-        Anchor("View Profile", href=f"/users/{user['id']}"),
+        H3(name),
+        Paragraph(f"Email: {email}"),
+        Paragraph(f"Role: {role}"),
+        Anchor("View Profile", href=f"/users/{user_id}"),
         class_name="card",
     )
 
 
+def user_card(user):
+    """Reusable user card component, cached per distinct user."""
+    return _user_card(user["id"], user["name"], user["email"], user["role"])
+
+
 def error_page(code, message):
     """Error page template."""
     return base_layout(
@@ -82,7 +95,7 @@ def fastapi_example():
 
     code = '''
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from nitro_ui import *
 
 app = FastAPI()
@@ -107,27 +120,31 @@ async def home():
     return page.render()
 
 
+@memoize(maxsize=10_000)
+def user_row(user_id: int, name: str, email: str):
+    """One card per distinct user, built once and reused across requests.
+
+    Keyed on every rendered field, so an edited user gets a fresh card.
+    """
+    return Div(
+        H3(name),
+        Paragraph(f"Email: {email}"),
+        Anchor("View", href=f"/users/{user_id}"),
+        class_name="card"
+    )
+
+
 @app.get("/users", response_class=HTMLResponse)
 async def list_users():
-    """List all users."""
+    """List all users, sent in chunks instead of one large string."""
     page = HTML(
         Head(Title("Users")),
         Body(
             H1("Users"),
-            Div(
-                *[
-                    Div(
-                        H3(user["name"]),
-                        Paragraph(f"Email: {user['email']}"),
-                        Anchor("View", href=f"/users/{user['id']}"),
-                        class_name="card"
-                    )
-                    for user in users_db
-                ]
-            )
+            Div(*[user_row(u["id"], u["name"], u["email"]) for u in users_db])
         )
     )
-    return page.render()
+    return StreamingResponse(page.render_iter(), media_type="text/html")
 
 
 @app.get("/users/{user_id}", response_class=HTMLResponse)
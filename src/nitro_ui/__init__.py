@@ -4,6 +4,7 @@ from .core.partial import Partial
 from .core.parser import from_html
 from .core.slot import Slot
 from .core.component import Component
+from .core.memo import memoize
 from .forms import Field
 from .tags.form import (
     Textarea,
@@ -147,6 +148,7 @@ __all__ = [
     "from_html",
     "Slot",
     "Component",
+    "memoize",
     "Field",
     # styles
     "CSSStyle",
@@ -2,5 +2,6 @@ from .element import HTMLElement
 from .fragment import Fragment
 from .partial import Partial
 from .parser import from_html
+from .memo import memoize
 
-__all__ = ["HTMLElement", "Fragment", "Partial", "from_html"]
+__all__ = ["HTMLElement", "Fragment", "Partial", "from_html", "memoize"]
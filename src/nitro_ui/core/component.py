@@ -39,6 +39,8 @@ class Component(HTMLElement):
         # </div>
     """
 
+    __slots__ = []
+
     tag: str = "div"
     class_name: str = None
 
@@ -3,9 +3,11 @@ import html
 import json
 import os
 import re
+import sys
 import uuid
 import warnings
-from typing import Callable, Any, Iterator, Union, List, Tuple
+from functools import lru_cache
+from typing import Callable, Any, Iterable, Iterator, Union, List, Tuple
 
 # Default maximum recursion depth for tree traversal operations
 DEFAULT_MAX_DEPTH = 1000
@@ -33,6 +35,16 @@ _BOOLEAN_ATTRIBUTES = frozenset({
     "readonly", "required", "reversed", "selected",
 })
 
+# Text and attribute escaping. html.escape's chained str.replace calls
+# are C-level no-ops for absent characters, which benchmarks faster than
+# a str.translate table on the short strings typical of markup.
+_escape = html.escape
+
+# Pretty-print indentation prefixes by depth; deeper levels fall back to
+# building the string.
+_INDENT_LEVELS = 64
+_INDENTS = tuple("  " * i for i in range(_INDENT_LEVELS))
+
 # Cache the environment variable check at module load time
 _GENERATE_IDS = bool(os.environ.get("NITRO_UI_GENERATE_IDS"))
 
@@ -115,6 +127,76 @@ def _build_svg_snake_map():
 _SVG_SNAKE_TO_CAMEL = _build_svg_snake_map()
 
 
+# Attributes that should keep underscores (not convert to hyphens)
+_PRESERVE_UNDERSCORE = frozenset({"class_name", "for_element"})
+
+# Map trailing underscore convention to NitroUI convention
+# e.g., class_ -> class_name, for_ -> for_element
+# Also support cls as a short alias for class_name
+_KEYWORD_MAPPINGS = {
+    "class_": "class_name",
+    "cls": "class_name",
+    "for_": "for_element",
+}
+
+# Map internal attribute names to HTML attribute names at render time
+_ATTR_RENDER_MAP = {
+    "class_name": "class",
+    "for_element": "for",
+}
+
+# Per-key render metadata: stored attribute key -> (HTML name, is boolean).
+# Attribute names repeat across every element, so the render-map lookup,
+# name validation and boolean check are done once per distinct key rather
+# than once per attribute per render. Invalid names are never cached.
+_ATTR_INFO: dict = {}
+_ATTR_INFO_MAX = 4096
+
+
+def _attr_render_info(k: str) -> Union[Tuple[str, bool], None]:
+    """Resolve and validate an attribute key, caching the result if valid."""
+    render_k = _ATTR_RENDER_MAP.get(k, k)
+    if not _VALID_ATTR_PATTERN.match(render_k):
+        return None
+    info = (render_k, render_k in _BOOLEAN_ATTRIBUTES)
+    if len(_ATTR_INFO) < _ATTR_INFO_MAX:
+        _ATTR_INFO[k] = info
+    return info
+
+
+# Serialized attribute fragments: (stored key, string value) -> the
+# escaped `` name="value"`` text written to the render buffer. Pairs like
+# ("class_name", "card") or ("type", "submit") recur across elements and
+# renders. Bounded by entry count and value length so per-record data
+# such as ids or URLs cannot grow it without limit; when full it is
+# cleared, so the pairs that are hot now get back in rather than the
+# cache staying pinned to whatever filled it first.
+_ATTR_FRAGMENTS: dict = {}
+_ATTR_FRAGMENTS_MAX = 8192
+_ATTR_FRAGMENT_VALUE_MAX = 128
+
+
+@lru_cache(maxsize=1024)
+def _normalize_attr_key(k: str) -> str:
+    """Translate a constructor kwarg name into the stored attribute key.
+
+    Results are memoized and interned: the same handful of kwarg names
+    recur across every element, so repeated constructions share one key
+    string instead of rebuilding ``data-*``/``aria-*`` names each time.
+    """
+    # First, handle keyword mappings (class_ -> class_name, for_ -> for_element)
+    if k in _KEYWORD_MAPPINGS:
+        return _KEYWORD_MAPPINGS[k]
+    # Preserve certain keys with underscores
+    if k in _PRESERVE_UNDERSCORE:
+        return k
+    # Check SVG camelCase map (view_box -> viewBox)
+    if k in _SVG_SNAKE_TO_CAMEL:
+        return _SVG_SNAKE_TO_CAMEL[k]
+    # Convert remaining underscores to hyphens (data_value -> data-value)
+    return sys.intern(k.replace("_", "-"))
+
+
 def _validate_css_value(value: str) -> bool:
     """Validate that a CSS value doesn't contain injection attacks.
 
@@ -129,6 +211,23 @@ def _validate_css_value(value: str) -> bool:
     return not _DANGEROUS_CSS_PATTERN.search(value)
 
 
+def _caller_stacklevel() -> int:
+    """Return the ``warnings.warn`` stacklevel of the first caller outside
+    nitro_ui, as seen from the function that calls this helper.
+
+    Rendering recurses to a tree-dependent depth, so a fixed stacklevel
+    would attribute render-time warnings to a frame inside this package.
+    """
+    level = 1
+    frame = sys._getframe(1)
+    while frame is not None and (
+        frame.f_globals.get("__name__", "").partition(".")[0] == "nitro_ui"
+    ):
+        frame = frame.f_back
+        level += 1
+    return level
+
+
 class HTMLElement:
     """Foundation class for every HTML element in NitroUI.
 
@@ -160,8 +259,17 @@ class HTMLElement:
         "_self_closing",
         "_styles_cache",
         "_prefix",
+        "_render_cache",
     ]
 
+    # True for subclasses that override render() rather than _render_into();
+    # parents then call their render() and splice the returned string.
+    _overrides_render = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._overrides_render = cls.render is not HTMLElement.render
+
     def __init__(
         self,
         *children: Union["HTMLElement", str, List[Any]],
@@ -186,18 +294,6 @@ class HTMLElement:
             ValueError: If ``tag`` is empty, malformed, or a child has an
                 unsupported type.
         """
-        # Attributes that should keep underscores (not convert to hyphens)
-        PRESERVE_UNDERSCORE = {"class_name", "for_element"}
-
-        # Map trailing underscore convention to NitroUI convention
-        # e.g., class_ -> class_name, for_ -> for_element
-        # Also support cls as a short alias for class_name
-        KEYWORD_MAPPINGS = {
-            "class_": "class_name",
-            "cls": "class_name",
-            "for_": "for_element",
-        }
-
         if not tag:
             raise ValueError("A valid HTML tag name is required")
 
@@ -209,20 +305,7 @@ class HTMLElement:
                 "letters, digits, and hyphens."
             )
 
-        def normalize_attr_key(k: str) -> str:
-            # First, handle keyword mappings (class_ -> class_name, for_ -> for_element)
-            if k in KEYWORD_MAPPINGS:
-                return KEYWORD_MAPPINGS[k]
-            # Preserve certain keys with underscores
-            if k in PRESERVE_UNDERSCORE:
-                return k
-            # Check SVG camelCase map (view_box -> viewBox)
-            if k in _SVG_SNAKE_TO_CAMEL:
-                return _SVG_SNAKE_TO_CAMEL[k]
-            # Convert remaining underscores to hyphens (data_value -> data-value)
-            return k.replace("_", "-")
-
-        fixed_attributes = {normalize_attr_key(k): v for k, v in attributes.items()}
+        fixed_attributes = {_normalize_attr_key(k): v for k, v in attributes.items()}
 
         self._tag: str = tag
         self._children: List[HTMLElement] = []
@@ -231,24 +314,14 @@ class HTMLElement:
         self._self_closing: bool = self_closing
         self._styles_cache: Union[dict, None] = None
         self._prefix: Union[str, None] = None
+        self._render_cache: Union[dict, None] = None
 
         if _GENERATE_IDS:
             self.generate_id()
 
         # Batch text children to avoid repeated string concatenation
         text_parts: List[str] = []
-        for child in self._flatten(children):
-            if isinstance(child, HTMLElement):
-                self._children.append(child)
-            elif isinstance(child, str):
-                text_parts.append(child)
-            elif child is not None:
-                # Raise error for invalid types
-                raise ValueError(
-                    f"Invalid child type: {type(child).__name__}."
-                    " Children must be HTMLElement instances"
-                    " or strings."
-                )
+        self._split_children(children, self._children, text_parts)
         if text_parts:
             self._text = "".join(text_parts)
 
@@ -287,13 +360,31 @@ class HTMLElement:
         pass
 
     @staticmethod
-    def _flatten(items: Union[List[Any], tuple]) -> Iterator[Any]:
-        """Recursively flattens nested iterables of children."""
-        for item in items:
-            if isinstance(item, (list, tuple)):
-                yield from HTMLElement._flatten(item)
-            else:
-                yield item
+    def _split_children(
+        items: Iterable[Any],
+        elements: List["HTMLElement"],
+        text_parts: List[str],
+    ) -> None:
+        """Sort children into ``elements`` and ``text_parts`` in one pass.
+
+        Strings go straight to the text list and nested lists/tuples are
+        flattened recursively; ``None`` is skipped.
+
+        Raises:
+            ValueError: If a child is not an ``HTMLElement`` or string.
+        """
+        for child in items:
+            if isinstance(child, HTMLElement):
+                elements.append(child)
+            elif isinstance(child, str):
+                text_parts.append(child)
+            elif isinstance(child, (list, tuple)):
+                HTMLElement._split_children(child, elements, text_parts)
+            elif child is not None:
+                raise ValueError(
+                    f"Invalid child type: {type(child).__name__}. "
+                    "Children must be HTMLElement instances or strings."
+                )
 
     def prepend(self, *children: Union["HTMLElement", str, List[Any]]) -> "HTMLElement":
         """Insert children at the front of this element.
@@ -318,19 +409,11 @@ class HTMLElement:
         """
         new_children: List[HTMLElement] = []
         text_parts: List[str] = []
-        for child in self._flatten(children):
-            if isinstance(child, HTMLElement):
-                new_children.append(child)
-            elif isinstance(child, str):
-                text_parts.append(child)
-            elif child is not None:
-                raise ValueError(
-                    f"Invalid child type: {type(child).__name__}. "
-                    "Children must be HTMLElement instances or strings."
-                )
+        self._split_children(children, new_children, text_parts)
         if text_parts:
             self._text = "".join(text_parts) + self._text
         self._children = new_children + self._children
+        self._invalidate_render_cache()
         return self
 
     def append(self, *children: Union["HTMLElement", str, List[Any]]) -> "HTMLElement":
@@ -355,18 +438,40 @@ class HTMLElement:
             '<div><h1>Title</h1><p>Body</p></div>'
         """
         text_parts: List[str] = []
-        for child in self._flatten(children):
-            if isinstance(child, HTMLElement):
-                self._children.append(child)
-            elif isinstance(child, str):
-                text_parts.append(child)
-            elif child is not None:
-                raise ValueError(
-                    f"Invalid child type: {type(child).__name__}. "
-                    "Children must be HTMLElement instances or strings."
-                )
+        self._split_children(children, self._children, text_parts)
+        if text_parts:
+            self._text += "".join(text_parts)
+        self._invalidate_render_cache()
+        return self
+
+    def extend(
+        self, children: Iterable[Union["HTMLElement", str, List[Any]]]
+    ) -> "HTMLElement":
+        """Add every item of an iterable to the end of this element.
+
+        Same rules as ``append()``, but takes the iterable itself, so a
+        generator is consumed in a single pass without first being
+        unpacked into an argument tuple.
+
+        Args:
+            children: Iterable of elements, strings, or nested
+                lists/tuples. ``None`` values are skipped.
+
+        Returns:
+            This element, for chaining.
+
+        Raises:
+            ValueError: If any child is not an ``HTMLElement`` or string.
+
+        Example:
+            >>> UnorderedList().extend(ListItem(n) for n in ("a", "b")).render()
+            '<ul><li>a</li><li>b</li></ul>'
+        """
+        text_parts: List[str] = []
+        self._split_children(children, self._children, text_parts)
         if text_parts:
             self._text += "".join(text_parts)
+        self._invalidate_render_cache()
         return self
 
     def filter(
@@ -426,6 +531,7 @@ class HTMLElement:
         for child in to_remove:
             if child in self._children:
                 self._children.remove(child)
+        self._invalidate_render_cache()
         return self
 
     def clear(self) -> "HTMLElement":
@@ -437,6 +543,7 @@ class HTMLElement:
             This element, for chaining.
         """
         self._children.clear()
+        self._invalidate_render_cache()
         return self
 
     def pop(self, index: int = 0) -> "HTMLElement":
@@ -452,7 +559,9 @@ class HTMLElement:
             IndexError: If the element has no children or the index is
                 out of range.
         """
-        return self._children.pop(index)
+        child = self._children.pop(index)
+        self._invalidate_render_cache()
+        return child
 
     def first(self) -> Union["HTMLElement", None]:
         """Return the first child, or ``None`` if this element has none."""
@@ -486,6 +595,7 @@ class HTMLElement:
             self._attributes[key] = value
         if key == "style":
             self._styles_cache = None
+        self._invalidate_render_cache()
         return self
 
     def add_attributes(self, attributes: List[Tuple[str, str]]) -> "HTMLElement":
@@ -522,6 +632,7 @@ class HTMLElement:
         self._attributes.pop(key, None)
         if key == "style":
             self._styles_cache = None
+        self._invalidate_render_cache()
         return self
 
     def get_attribute(self, key: str) -> Union[str, None]:
@@ -550,6 +661,7 @@ class HTMLElement:
                 self._attributes["style"] = self._format_styles(self._styles_cache)
             else:
                 self._attributes.pop("style", None)
+            self._invalidate_render_cache()
 
     def add_style(self, key: str, value: str) -> "HTMLElement":
         """Add a single inline CSS declaration to this element.
@@ -706,11 +818,57 @@ class HTMLElement:
         """
         if "id" not in self._attributes:
             self._attributes["id"] = f"el-{str(uuid.uuid4())[:6]}"
+            self._invalidate_render_cache()
 
     def clone(self) -> "HTMLElement":
         """Return a deep copy of this element and its entire subtree."""
         return copy.deepcopy(self)
 
+    def freeze(self) -> "HTMLElement":
+        """Cache this element's rendered HTML and reuse it on later renders.
+
+        The first ``render()`` of a frozen element walks the subtree as
+        usual; subsequent renders with the same ``pretty`` / indent
+        settings return the stored string without visiting children or
+        calling their render hooks. Use it for static chrome (headers,
+        footers, navigation) that is rendered many times.
+
+        Mutating methods called on this element discard the cached
+        output. Changes made directly to descendants are not tracked -
+        call ``unfreeze()`` (or mutate this element) after editing a
+        frozen subtree.
+
+        Returns:
+            This element, for chaining.
+
+        Example:
+            >>> footer = Footer(Paragraph("(c) 2025")).freeze()
+            >>> footer.render() is footer.render()
+            True
+        """
+        if self._render_cache is None:
+            self._render_cache = {}
+        return self
+
+    def unfreeze(self) -> "HTMLElement":
+        """Stop caching rendered output and drop anything already cached.
+
+        Returns:
+            This element, for chaining.
+        """
+        self._render_cache = None
+        return self
+
+    @property
+    def frozen(self) -> bool:
+        """Whether ``freeze()`` is active on this element."""
+        return self._render_cache is not None
+
+    def _invalidate_render_cache(self) -> None:
+        """Discard cached render output after this element is mutated."""
+        if self._render_cache:
+            self._render_cache.clear()
+
     def replace_child(self, old_index: int, new_child: "HTMLElement") -> None:
         """Swap a child at the given index with a new element.
 
@@ -727,6 +885,7 @@ class HTMLElement:
                 f"new_child must be an HTMLElement, got {type(new_child).__name__}"
             )
         self._children[old_index] = new_child
+        self._invalidate_render_cache()
 
     def find_by_attribute(
         self,
@@ -832,6 +991,7 @@ class HTMLElement:
                 "letters, digits, and hyphens."
             )
         self._tag = value
+        self._invalidate_render_cache()
 
     @property
     def children(self) -> List["HTMLElement"]:
@@ -845,6 +1005,7 @@ class HTMLElement:
     @children.setter
     def children(self, value: List["HTMLElement"]) -> None:
         self._children = value
+        self._invalidate_render_cache()
 
     @property
     def text(self) -> str:
@@ -854,6 +1015,7 @@ class HTMLElement:
     @text.setter
     def text(self, value: str) -> None:
         self._text = value
+        self._invalidate_render_cache()
 
     @property
     def attributes(self) -> dict:
@@ -864,6 +1026,7 @@ class HTMLElement:
     def attributes(self, value: dict) -> None:
         self._attributes = value
         self._styles_cache = None
+        self._invalidate_render_cache()
 
     @property
     def self_closing(self) -> bool:
@@ -873,28 +1036,37 @@ class HTMLElement:
     @self_closing.setter
     def self_closing(self, value: bool) -> None:
         self._self_closing = value
+        self._invalidate_render_cache()
 
-    def _render_attributes(self) -> str:
-        """Returns a string of HTML attributes for the tag."""
-        # Map internal attribute names to HTML attribute names
-        ATTR_RENDER_MAP = {
-            "class_name": "class",
-            "for_element": "for",
-        }
-
-        def render_key(k: str) -> str:
-            return ATTR_RENDER_MAP.get(k, k)
+    def _write_attributes(self, buf: List[str]) -> None:
+        """Append `` key="value"`` pairs for this element's attributes to ``buf``.
 
-        parts = []
-        for k, v in self._attributes.items():
-            render_k = render_key(k)
+        Each attribute is written as one pre-spaced fragment straight into
+        the render buffer, so no per-element list or joined string is built.
+        """
+        attributes = self._attributes
+        if not attributes:
+            return
+        attr_info = _ATTR_INFO
+        fragments = _ATTR_FRAGMENTS
+        append = buf.append
+        for k, v in attributes.items():
+            # Reuse the serialized fragment for a pair written before
+            if type(v) is str:
+                frag = fragments.get((k, v))
+                if frag is not None:
+                    append(frag)
+                    continue
+
+            info = attr_info.get(k) or _attr_render_info(k)
 
             # Validate attribute key to prevent injection
-            if not _VALID_ATTR_PATTERN.match(render_k):
+            if info is None:
+                render_k = _ATTR_RENDER_MAP.get(k, k)
                 warnings.warn(
                     f"Skipping invalid attribute name: {render_k!r}",
                     UserWarning,
-                    stacklevel=3,
+                    stacklevel=_caller_stacklevel(),
                 )
                 continue
 
@@ -902,20 +1074,22 @@ class HTMLElement:
             if v is None:
                 continue
 
+            render_k, is_boolean = info
+
             # Handle boolean attributes
-            if render_k in _BOOLEAN_ATTRIBUTES:
-                if v is True or v == "" or v == render_k:
-                    parts.append(render_k)
-                elif v is False:
-                    continue  # Omit the attribute entirely
-                else:
-                    # Non-boolean value on a boolean attribute, render normally
-                    parts.append(f'{render_k}="{html.escape(str(v), quote=True)}"')
+            if is_boolean and (v is True or v == "" or v == render_k):
+                frag = f" {render_k}"
+            elif is_boolean and v is False:
+                continue  # Omit the attribute entirely
             else:
-                parts.append(f'{render_k}="{html.escape(str(v), quote=True)}"')
+                # Includes non-boolean values on a boolean attribute
+                frag = f' {render_k}="{_escape(v if type(v) is str else str(v))}"'
+            append(frag)
 
-        attr_str = " ".join(parts)
-        return f" {attr_str}" if attr_str else ""
+            if type(v) is str and len(v) <= _ATTR_FRAGMENT_VALUE_MAX:
+                if len(fragments) >= _ATTR_FRAGMENTS_MAX:
+                    fragments.clear()
+                fragments[(k, v)] = frag
 
     def render(
         self,
@@ -946,61 +1120,278 @@ class HTMLElement:
             >>> Div(Paragraph("Hi"), class_name="card").render()
             '<div class="card"><p>Hi</p></div>'
         """
-        if _indent > max_depth:
+        buf: List[str] = []
+        self._render_into(buf, pretty, _indent, max_depth)
+        return "".join(buf)
+
+    def render_to(
+        self,
+        out: Any,
+        pretty: bool = False,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+    ) -> None:
+        """Stream this element's HTML to a writable text stream.
+
+        Produces exactly the same output as ``render()``, but passes each
+        fragment to ``out.write()`` as it is generated instead of joining
+        the whole document into one string first.
+
+        Args:
+            out: Any object with a ``write(str)`` method - ``sys.stdout``,
+                an open text file, ``io.StringIO``, a response stream.
+            pretty: If ``True``, insert indentation and newlines.
+            max_depth: Traversal cutoff (default 1000) guarding against
+                circular references in the tree.
+
+        Raises:
+            RecursionError: If ``max_depth`` is exceeded.
+
+        Example:
+            >>> import io
+            >>> out = io.StringIO()
+            >>> Div(Paragraph("Hi")).render_to(out)
+            >>> out.getvalue()
+            '<div><p>Hi</p></div>'
+        """
+        if self._overrides_render:
+            out.write(self.render(pretty=pretty, max_depth=max_depth))
+            return
+        self._render_into(_WriterBuffer(out.write), pretty, 0, max_depth)
+
+    def render_iter(
+        self,
+        pretty: bool = False,
+        chunk_size: int = 8192,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+    ) -> Iterator[str]:
+        """Yield this element's HTML as a series of string chunks.
+
+        Concatenating the chunks gives exactly the output of ``render()``.
+        The tree is serialized lazily: the walk pauses after each child
+        subtree once at least ``chunk_size`` characters are pending, so the
+        first chunk is available before later siblings are rendered and
+        only about one chunk of output is held at a time. Suitable as a
+        WSGI response body or for a streaming response in ASGI frameworks.
+
+        Frozen subtrees, leaves and elements with custom serializers are
+        rendered in one piece, so a chunk may run past ``chunk_size``.
+
+        Args:
+            pretty: If ``True``, insert indentation and newlines.
+            chunk_size: Minimum length in characters of every chunk except
+                the last.
+            max_depth: Traversal cutoff (default 1000) guarding against
+                circular references in the tree.
+
+        Yields:
+            Consecutive pieces of the rendered HTML.
+
+        Raises:
+            RecursionError: If ``max_depth`` is exceeded.
+
+        Example:
+            >>> "".join(Div(Paragraph("Hi")).render_iter())
+            '<div><p>Hi</p></div>'
+        """
+        if self._overrides_render:
+            yield self.render(pretty=pretty, max_depth=max_depth)
+            return
+        out = _ChunkBuffer(chunk_size)
+        yield from self._iter_render(out, pretty, 0, max_depth)
+        if out.parts:
+            yield "".join(out.parts)
+
+    def _render_into(
+        self, buf: List[str], pretty: bool, indent: int, max_depth: int
+    ) -> None:
+        """Append this element's HTML to ``buf`` as a sequence of fragments.
+
+        The whole tree writes into the one list allocated by ``render()``,
+        so output is joined exactly once instead of at every level. The
+        compact/pretty choice is made here, once per render; each
+        serializer then recurses into its own kind.
+        """
+        if pretty:
+            self._render_pretty(buf, indent, max_depth)
+        else:
+            self._render_compact(buf, indent, max_depth)
+
+    def _render_compact(self, buf: List[str], depth: int, max_depth: int) -> None:
+        """Serialize without whitespace. Subclasses override this and
+        ``_render_pretty`` to change how they render."""
+        if depth > max_depth:
             raise RecursionError(
                 f"Maximum recursion depth ({max_depth}) exceeded in render(). "
                 "This usually indicates a circular reference in the element tree. "
                 "Consider increasing max_depth if you have deeply nested HTML."
             )
 
+        cache = self._render_cache
+        if cache is not None:
+            cached = cache.get(_COMPACT_CACHE_KEY)
+            if cached is not None:
+                buf.append(cached)
+                return
+            outer, buf = buf, []
+
         self.on_before_render()
 
-        attributes = self._render_attributes()
-        indent_str = "  " * _indent if pretty else ""
-        tag_start = f"{indent_str}<{self._tag}{attributes}"
+        if self._prefix:
+            buf.append(self._prefix)
 
+        tag_open, tag_close, _ = _TAG_FRAGMENTS.get(self._tag) or _tag_fragments(
+            self._tag
+        )
         if self._self_closing:
-            parts = [tag_start, " />"]
-            if pretty:
-                parts.append("\n")
-            result = "".join(parts)
+            buf.append(tag_open)
+            self._write_attributes(buf)
+            buf.append(" />")
+        elif not self._children and not self._attributes:
+            # Text-only leaf such as Title("...") or Code("..."): emit the
+            # whole element as one fragment.
+            buf.append(f"{tag_open}>{_escape(self._text)}{tag_close}")
         else:
-            if pretty and self._children:
-                children_html = "".join(
-                    child.render(pretty=True, _indent=_indent + 1, max_depth=max_depth)
-                    for child in self._children
-                )
-                escaped_text = html.escape(self._text)
-
-                if self._children or self._text:
-                    parts = [tag_start, ">"]
-                    if escaped_text:
-                        parts.append(escaped_text)
-                    if self._children:
-                        parts.extend(["\n", children_html, indent_str])
-                    parts.append(f"</{self._tag}>\n")
-                    result = "".join(parts)
+            append = buf.append
+            append(tag_open)
+            self._write_attributes(buf)
+            append(">")
+            if self._text:
+                append(_escape(self._text))
+            child_depth = depth + 1
+            for child in self._children:
+                if child._overrides_render:
+                    append(child.render(_indent=child_depth, max_depth=max_depth))
                 else:
-                    result = f"{tag_start}></{self._tag}>\n"
-            elif pretty:
-                # Pretty mode but no children - still add newline
-                escaped_text = html.escape(self._text)
-                result = f"{tag_start}>{escaped_text}</{self._tag}>\n"
-            else:
-                children_html = "".join(
-                    child.render(
-                        pretty=pretty, _indent=_indent + 1, max_depth=max_depth
-                    )
-                    for child in self._children
-                )
-                escaped_text = html.escape(self._text)
-                result = f"{tag_start}>{escaped_text}{children_html}</{self._tag}>"
+                    child._render_compact(buf, child_depth, max_depth)
+            append(tag_close)
+
+        self.on_after_render()
+        if cache is not None:
+            _store_rendered(cache, _COMPACT_CACHE_KEY, buf, outer)
+
+    def _render_pretty(self, buf: List[str], indent: int, max_depth: int) -> None:
+        """Serialize with two-space indentation and a newline per element."""
+        if indent > max_depth:
+            raise RecursionError(
+                f"Maximum recursion depth ({max_depth}) exceeded in render(). "
+                "This usually indicates a circular reference in the element tree. "
+                "Consider increasing max_depth if you have deeply nested HTML."
+            )
+
+        cache = self._render_cache
+        if cache is not None:
+            cached = cache.get((True, indent))
+            if cached is not None:
+                buf.append(cached)
+                return
+            outer, buf = buf, []
+
+        self.on_before_render()
 
         if self._prefix:
-            result = f"{self._prefix}{result}"
+            buf.append(self._prefix)
+
+        tag_open, _, tag_close_nl = _TAG_FRAGMENTS.get(self._tag) or _tag_fragments(
+            self._tag
+        )
+        append = buf.append
+        indent_str = _INDENTS[indent] if indent < _INDENT_LEVELS else "  " * indent
+        append(indent_str)
+        append(tag_open)
+        self._write_attributes(buf)
+
+        if self._self_closing:
+            append(" />\n")
+        else:
+            append(">")
+            if self._text:
+                append(_escape(self._text))
+            children = self._children
+            if children:
+                append("\n")
+                child_indent = indent + 1
+                for child in children:
+                    if child._overrides_render:
+                        append(
+                            child.render(
+                                pretty=True, _indent=child_indent, max_depth=max_depth
+                            )
+                        )
+                    else:
+                        child._render_pretty(buf, child_indent, max_depth)
+                append(indent_str)
+            append(tag_close_nl)
+
+        self.on_after_render()
+        if cache is not None:
+            _store_rendered(cache, (True, indent), buf, outer)
+
+    def _iter_render(
+        self, out: "_ChunkBuffer", pretty: bool, indent: int, max_depth: int
+    ) -> Iterator[str]:
+        """Render into ``out.parts``, yielding full chunks between children.
+
+        Mirrors ``_render_compact``/``_render_pretty`` for an element whose
+        children are walked one at a time. Subtrees that cannot be split
+        (frozen, childless, void, or with a custom serializer) are written
+        in one piece through ``_render_into``.
+        """
+        method = "_render_pretty" if pretty else "_render_compact"
+        if (
+            self._render_cache is not None
+            or self._self_closing
+            or not self._children
+            or getattr(type(self), method) is not getattr(HTMLElement, method)
+        ):
+            self._render_into(out.parts, pretty, indent, max_depth)
+            return
+        if indent > max_depth:
+            raise RecursionError(
+                f"Maximum recursion depth ({max_depth}) exceeded in render(). "
+                "This usually indicates a circular reference in the element tree. "
+                "Consider increasing max_depth if you have deeply nested HTML."
+            )
 
+        self.on_before_render()
+
+        buf = out.parts
+        if self._prefix:
+            buf.append(self._prefix)
+        tag_open, tag_close, tag_close_nl = _TAG_FRAGMENTS.get(
+            self._tag
+        ) or _tag_fragments(self._tag)
+        if pretty:
+            indent_str = _INDENTS[indent] if indent < _INDENT_LEVELS else "  " * indent
+            buf.append(indent_str)
+        buf.append(tag_open)
+        self._write_attributes(buf)
+        buf.append(">")
+        if self._text:
+            buf.append(_escape(self._text))
+        if pretty:
+            buf.append("\n")
+
+        child_indent = indent + 1
+        for child in self._children:
+            if child._overrides_render:
+                out.parts.append(
+                    child.render(
+                        pretty=pretty, _indent=child_indent, max_depth=max_depth
+                    )
+                )
+            else:
+                yield from child._iter_render(out, pretty, child_indent, max_depth)
+            chunk = out.take()
+            if chunk is not None:
+                yield chunk
+
+        buf = out.parts
+        if pretty:
+            buf.append(indent_str)
+            buf.append(tag_close_nl)
+        else:
+            buf.append(tag_close)
         self.on_after_render()
-        return result
 
     def to_dict(
         self,
@@ -1175,7 +1566,78 @@ class HTMLElement:
 # Populated by tag_factory and tag modules at import time
 _TAG_REGISTRY: dict = {}
 
+# Prebuilt ("<tag", "</tag>", "</tag>\n") strings per tag name, so render
+# appends constants instead of formatting the tag for every element.
+# Bounded so arbitrary custom tags (e.g. from parsed input) cannot grow it
+# without limit; tags seen after it fills are formatted on each render.
+_TAG_FRAGMENTS: dict = {}
+_TAG_FRAGMENTS_MAX = 1024
+
+
+def _tag_fragments(tag_name: str) -> Tuple[str, str, str]:
+    """Build, and cache while there is room, the open/close strings for a tag."""
+    fragments = (f"<{tag_name}", f"</{tag_name}>", f"</{tag_name}>\n")
+    if len(_TAG_FRAGMENTS) < _TAG_FRAGMENTS_MAX:
+        _TAG_FRAGMENTS[tag_name] = fragments
+    return fragments
+
+
+# freeze() cache key for compact output, which does not depend on depth.
+# Pretty output is keyed by (True, indent).
+_COMPACT_CACHE_KEY = (False, 0)
+
+
+def _store_rendered(cache: dict, key: tuple, buf: List[str], outer: List[str]) -> None:
+    """Join a frozen element's private ``buf``, cache it and emit it to ``outer``.
+
+    Frozen elements render into a fresh list so the output buffer only
+    ever needs ``append`` - which lets ``render_to()`` stream into any
+    ``write()`` target.
+    """
+    result = "".join(buf)
+    cache[key] = result
+    outer.append(result)
+
+
+class _WriterBuffer:
+    """Render buffer that forwards each fragment to a ``write`` callable."""
+
+    __slots__ = ["append"]
+
+    def __init__(self, write: Callable[[str], Any]):
+        self.append = write
+
+
+class _ChunkBuffer:
+    """Render buffer for ``render_iter()`` that hands out joined chunks.
+
+    Renderers append to ``parts`` as to any buffer; ``take()`` is called
+    between children and returns the pending output once it reaches
+    ``chunk_size`` characters. Each fragment's length is counted once.
+    """
+
+    __slots__ = ["parts", "chunk_size", "_size", "_counted"]
+
+    def __init__(self, chunk_size: int):
+        self.parts: List[str] = []
+        self.chunk_size = chunk_size
+        self._size = 0
+        self._counted = 0
+
+    def take(self) -> Union[str, None]:
+        parts = self.parts
+        self._size += sum(map(len, parts[self._counted :]))
+        self._counted = len(parts)
+        if self._size < self.chunk_size:
+            return None
+        chunk = "".join(parts)
+        self.parts = []
+        self._size = 0
+        self._counted = 0
+        return chunk
+
 
 def register_tag(tag_name: str, tag_class: type) -> None:
     """Register a tag class for from_dict() reconstruction."""
     _TAG_REGISTRY[tag_name] = tag_class
+    _tag_fragments(tag_name)
@@ -1,7 +1,13 @@
-import html as html_module
-from typing import Union, List, Any
+from typing import Union, List, Any, Iterator
 
-from nitro_ui.core.element import HTMLElement, DEFAULT_MAX_DEPTH, register_tag
+from nitro_ui.core.element import (
+    HTMLElement,
+    register_tag,
+    _escape,
+    _store_rendered,
+    _COMPACT_CACHE_KEY,
+    _ChunkBuffer,
+)
 
 
 class Fragment(HTMLElement):
@@ -18,57 +24,96 @@ class Fragment(HTMLElement):
         # Instead of: <fragment><h1>Title</h1><p>Content</p></fragment>
     """
 
+    __slots__ = []
+
     def __init__(
         self, *children: Union["HTMLElement", str, List[Any]], **attributes: str
     ):
         # Initialize with a dummy tag name since we won't render it
         super().__init__(*children, tag="fragment", **attributes)
 
-    def render(
-        self,
-        pretty: bool = False,
-        _indent: int = 0,
-        max_depth: int = DEFAULT_MAX_DEPTH,
-    ) -> str:
+    def _render_compact(self, buf: List[str], depth: int, max_depth: int) -> None:
         """Renders only the children without the fragment wrapper.
 
-        Args:
-            pretty: If True, renders children with indentation
-            _indent: Internal parameter for tracking indentation level
-            max_depth: Maximum recursion depth (default 1000) to prevent stack overflow
-
-        Returns:
-            HTML string of all children concatenated
+        Children are rendered at the fragment's own depth, preceded by
+        any text content.
 
         Raises:
             RecursionError: If max_depth is exceeded
         """
-        if _indent > max_depth:
+        self._render_children(buf, False, depth, max_depth)
+
+    def _render_pretty(self, buf: List[str], indent: int, max_depth: int) -> None:
+        """Pretty-print only the children, at the fragment's own indent."""
+        self._render_children(buf, True, indent, max_depth)
+
+    def _render_children(
+        self, buf: List[str], pretty: bool, indent: int, max_depth: int
+    ) -> None:
+        if indent > max_depth:
             raise RecursionError(
                 f"Maximum recursion depth ({max_depth}) exceeded in Fragment.render(). "
                 "This usually indicates a circular reference in the element tree."
             )
 
+        key = (True, indent) if pretty else _COMPACT_CACHE_KEY
+        cache = self._render_cache
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                buf.append(cached)
+                return
+            outer, buf = buf, []
+
         self.on_before_render()
 
+        # Include text content if any
+        if self._text:
+            buf.append(_escape(self._text))
+
         # Render only children, not the fragment tag itself
-        if pretty:
-            result = "".join(
-                child.render(pretty=True, _indent=_indent, max_depth=max_depth)
-                for child in self._children
-            )
-        else:
-            result = "".join(
-                child.render(pretty=False, _indent=_indent, max_depth=max_depth)
-                for child in self._children
+        for child in self._children:
+            if child._overrides_render:
+                buf.append(
+                    child.render(pretty=pretty, _indent=indent, max_depth=max_depth)
+                )
+            else:
+                child._render_into(buf, pretty, indent, max_depth)
+
+        self.on_after_render()
+        if cache is not None:
+            _store_rendered(cache, key, buf, outer)
+
+    def _iter_render(
+        self, out: _ChunkBuffer, pretty: bool, indent: int, max_depth: int
+    ) -> Iterator[str]:
+        """Stream only the children, yielding chunks between them."""
+        if self._render_cache is not None:
+            self._render_children(out.parts, pretty, indent, max_depth)
+            return
+        if indent > max_depth:
+            raise RecursionError(
+                f"Maximum recursion depth ({max_depth}) exceeded in Fragment.render(). "
+                "This usually indicates a circular reference in the element tree."
             )
 
-        # Include text content if any
+        self.on_before_render()
+
         if self._text:
-            result = html_module.escape(self._text) + result
+            out.parts.append(_escape(self._text))
+
+        for child in self._children:
+            if child._overrides_render:
+                out.parts.append(
+                    child.render(pretty=pretty, _indent=indent, max_depth=max_depth)
+                )
+            else:
+                yield from child._iter_render(out, pretty, indent, max_depth)
+            chunk = out.take()
+            if chunk is not None:
+                yield chunk
 
         self.on_after_render()
-        return result
 
 
 # Register fragment tag for from_dict() reconstruction
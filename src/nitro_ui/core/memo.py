@@ -0,0 +1,52 @@
+from functools import lru_cache, wraps
+from typing import Callable, Union
+
+from nitro_ui.core.element import HTMLElement
+
+
+def memoize(maxsize: Union[int, Callable, None] = 128) -> Callable:
+    """Cache a component factory's output per unique set of arguments.
+
+    The decorated function is called once for each distinct (hashable)
+    argument tuple. Its result is frozen, so the subtree is serialized
+    once per render mode and every later call with the same arguments
+    returns the same element with its cached HTML. Useful for cards,
+    rows and other fragments that repeat with identical props.
+
+    The returned element is shared between callers: treat it as
+    read-only. Mutating it discards its cached HTML and the change is
+    visible everywhere the element is used.
+
+    Args:
+        maxsize: Maximum number of distinct argument tuples to keep, or
+            ``None`` for an unbounded cache. May be omitted when used as
+            a bare ``@memoize`` decorator.
+
+    Returns:
+        A decorator, or the wrapped factory when applied directly. The
+        wrapper exposes ``cache_info()`` and ``cache_clear()``.
+
+    Example:
+        >>> @memoize(maxsize=256)
+        ... def product_card(name, price):
+        ...     return Div(H3(name), Paragraph(f"${price:.2f}"))
+        >>> product_card("Mouse", 29.99) is product_card("Mouse", 29.99)
+        True
+    """
+    if callable(maxsize):
+        return memoize()(maxsize)
+
+    def decorator(factory: Callable[..., HTMLElement]) -> Callable[..., HTMLElement]:
+        @lru_cache(maxsize=maxsize)
+        def build(*args, **kwargs) -> HTMLElement:
+            return factory(*args, **kwargs).freeze()
+
+        @wraps(factory)
+        def wrapper(*args, **kwargs) -> HTMLElement:
+            return build(*args, **kwargs)
+
+        wrapper.cache_info = build.cache_info
+        wrapper.cache_clear = build.cache_clear
+        return wrapper
+
+    return decorator
@@ -1,4 +1,6 @@
-from nitro_ui.core.element import HTMLElement, DEFAULT_MAX_DEPTH
+from typing import List
+
+from nitro_ui.core.element import HTMLElement
 
 
 class Partial(HTMLElement):
@@ -27,21 +29,12 @@ class Partial(HTMLElement):
         self._html = html
         self._file = file
 
-    def render(
-        self,
-        pretty: bool = False,
-        _indent: int = 0,
-        max_depth: int = DEFAULT_MAX_DEPTH,
-    ) -> str:
-        """Renders the raw HTML content.
-
-        Args:
-            pretty: Ignored (raw HTML is returned as-is)
-            _indent: Ignored (raw HTML is returned as-is)
-            max_depth: Ignored (no recursion needed)
+    def _render_compact(self, buf: List[str], depth: int, max_depth: int) -> None:
+        """Emits the raw HTML content.
 
-        Returns:
-            The raw HTML string
+        Used for both compact and pretty output: ``depth`` and
+        ``max_depth`` are ignored - raw HTML is emitted as-is and needs
+        no recursion.
 
         Raises:
             FileNotFoundError: If file path doesn't exist
@@ -51,12 +44,13 @@ class Partial(HTMLElement):
 
         if self._file:
             with open(self._file, "r", encoding="utf-8") as f:
-                result = f.read()
+                buf.append(f.read())
         else:
-            result = self._html
+            buf.append(self._html)
 
         self.on_after_render()
-        return result
+
+    _render_pretty = _render_compact
 
     def to_dict(self) -> dict:
         """Return a dict with ``type="partial"`` plus the source marker.
@@ -29,6 +29,8 @@ class Slot(HTMLElement):
         )
     """
 
+    __slots__ = ["slot_name", "slot_default"]
+
     def __init__(
         self,
         name: str = None,
@@ -51,12 +53,11 @@ class Slot(HTMLElement):
             return f"Slot({self.slot_name!r})"
         return "Slot()"
 
-    def render(
-        self, pretty: bool = False, _indent: int = 0, max_depth: int = 1000
-    ) -> str:
-        """Return an empty string - ``Component`` replaces slots before render.
+    def _render_compact(self, buf: List[str], depth: int, max_depth: int) -> None:
+        """Emit nothing - ``Component`` replaces slots before render.
 
         This safety net keeps output clean if a ``Slot`` escapes the
         component machinery. It should never be called during normal use.
         """
-        return ""
+
+    _render_pretty = _render_compact
@@ -18,6 +18,8 @@ Datalist = simple_tag_class("datalist")
 class Select(BaseSelect):
     """HTML ``<select>`` dropdown with a convenience option builder."""
 
+    __slots__ = []
+
     @classmethod
     def with_items(cls, *items, **kwargs) -> "Select":
         """Build a ``<select>`` and wrap plain items as ``<option>`` children.
@@ -37,13 +39,9 @@ class Select(BaseSelect):
             >>> Select.with_items("Red", "Green", "Blue", name="color").render()
             '<select name="color"><option>Red</option><option>Green</option><option>Blue</option></select>'
         """
-        opt = cls(**kwargs)
-        for item in items:
-            if isinstance(item, HTMLElement):
-                opt.append(item)
-            else:
-                opt.append(Option(item))
-        return opt
+        return cls(**kwargs).extend(
+            item if isinstance(item, HTMLElement) else Option(item) for item in items
+        )
 
 
 register_tag("select", Select)
@@ -65,8 +63,10 @@ Label = simple_tag_class("label", extra_init=label_extra_init)
 class Form(HTMLElement):
     """HTML ``<form>`` element with a convenience field-appending builder."""
 
+    __slots__ = []
+
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, **{**kwargs, "tag": "form"})
+        super().__init__(*args, tag="form", **kwargs)
 
     @classmethod
     def with_fields(cls, *items, **kwargs) -> "Form":
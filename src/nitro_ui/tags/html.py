@@ -14,6 +14,8 @@ class HTML(HTMLElement):
         True
     """
 
+    __slots__ = []
+
     def __init__(self, *args, **kwargs):
         super().__init__(
             *args,
@@ -10,8 +10,10 @@ DescriptionTerm = simple_tag_class("dt")
 class UnorderedList(HTMLElement):
     """HTML ``<ul>`` element with a convenience item-wrapping builder."""
 
+    __slots__ = []
+
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, **{**kwargs, "tag": "ul"})
+        super().__init__(*args, tag="ul", **kwargs)
 
     @classmethod
     def with_items(cls, *items, **kwargs) -> "UnorderedList":
@@ -46,8 +48,10 @@ register_tag("ul", UnorderedList)
 class OrderedList(HTMLElement):
     """HTML ``<ol>`` element with a convenience item-wrapping builder."""
 
+    __slots__ = []
+
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, **{**kwargs, "tag": "ol"})
+        super().__init__(*args, tag="ol", **kwargs)
 
     @classmethod
     def with_items(cls, *items, **kwargs) -> "OrderedList":
@@ -18,8 +18,10 @@ Colgroup = simple_tag_class("colgroup")
 class Table(HTMLElement):
     """HTML ``<table>`` element with helpers for loading data from files."""
 
+    __slots__ = []
+
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, **{**kwargs, "tag": "table"})
+        super().__init__(*args, tag="table", **kwargs)
 
     @classmethod
     def from_csv(cls, file_path: str, encoding: str = "utf-8") -> "Table":
@@ -58,17 +58,14 @@ def simple_tag_class(
         creation time. See :func:`simple_tag_class` for details.
         """
 
+        __slots__ = []
+
         def __init__(self, *args, **kwargs):
             if extra_init:
                 extra_init(self, kwargs)
-            super().__init__(
-                *args,
-                **{
-                    **kwargs,
-                    "tag": tag,
-                    **({"self_closing": True} if self_closing else {}),
-                },
-            )
+            if self_closing:
+                kwargs["self_closing"] = True
+            super().__init__(*args, tag=tag, **kwargs)
 
     # __qualname__ is set so pickling and serialization refer to the
     # logical class name (e.g. "Div") rather than "_Tag".
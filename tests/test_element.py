@@ -1,3 +1,4 @@
+import io
 import unittest
 
 from nitro_ui.core.element import HTMLElement
@@ -5,6 +6,25 @@ from nitro_ui.tags.layout import Div
 from nitro_ui.tags.text import Span, Paragraph
 
 
+class Upper(HTMLElement):
+    """Element that overrides render() rather than the internal serializers."""
+
+    def render(self, pretty=False, _indent=0, max_depth=1000):
+        return super().render(pretty, _indent, max_depth).upper()
+
+
+def streaming_tree():
+    """Tree mixing escaping, a Fragment and a frozen subtree."""
+    from nitro_ui.core.fragment import Fragment
+
+    return Div(
+        Paragraph("a < b", class_name="x"),
+        Fragment(Span("one"), Span("two")),
+        Div(Span("frozen")).freeze(),
+        id="root",
+    )
+
+
 class TestHTMLElement(unittest.TestCase):
 
     def test_prepend(self):
@@ -23,6 +43,45 @@ class TestHTMLElement(unittest.TestCase):
         self.assertEqual(len(element.children), 1)
         self.assertEqual(str(element.children[0]), "<div></div>")
 
+    def test_extend(self):
+        element = Div("a")
+        result = element.extend(Span(str(i)) for i in range(3))
+        self.assertIs(result, element)
+        self.assertEqual(element.count_children(), 3)
+        element.extend(["b", [Span("3")], None])
+        self.assertEqual(
+            element.render(),
+            "<div>ab<span>0</span><span>1</span><span>2</span><span>3</span></div>",
+        )
+        with self.assertRaises(ValueError):
+            element.extend([42])
+
+    def test_tag_classes_have_no_instance_dict(self):
+        """Built-in element classes are fully slotted."""
+        from nitro_ui.core.fragment import Fragment
+        from nitro_ui.tags.form import Form, Select
+
+        for element in (Div(), Span(), Fragment(), Form(), Select()):
+            self.assertFalse(hasattr(element, "__dict__"), type(element).__name__)
+
+    def test_arbitrary_attributes_rejected_on_tag_classes(self):
+        """Intended breaking change: built-in tags are slotted, so ad-hoc
+        Python attributes raise; user subclasses still accept them."""
+        from nitro_ui.tags.form import Input
+
+        with self.assertRaises(AttributeError):
+            Div().foo = 1
+        with self.assertRaises(AttributeError):
+            Input().bound_field = "email"
+
+        class BoundInput(Input):
+            pass
+
+        field = BoundInput(name="email")
+        field.bound_field = "email"
+        self.assertEqual(field.bound_field, "email")
+        self.assertEqual(field.render(), '<input name="email" />')
+
     def test_filter(self):
         """Test the filter() method."""
         element = HTMLElement(tag="div")
@@ -248,6 +307,19 @@ class TestHTMLElement(unittest.TestCase):
         self.assertIn("&lt;script&gt;", rendered)
         self.assertNotIn('"><script>', rendered)
 
+    def test_repeated_attribute_values_render_consistently(self):
+        """Reused attribute pairs stay escaped and boolean-aware."""
+        for _ in range(2):
+            element = HTMLElement(
+                tag="input", title='a "b" <c>', disabled="", class_name="x"
+            )
+            self.assertEqual(
+                str(element),
+                '<input title="a &quot;b&quot; &lt;c&gt;" disabled class="x"></input>',
+            )
+        other = HTMLElement(tag="div", title='a "b" <c>')
+        self.assertEqual(str(other), '<div title="a &quot;b&quot; &lt;c&gt;"></div>')
+
     def test_html_escaping_normal_content(self):
         """Test that normal content is not affected by escaping."""
         normal_text = "Hello, World!"
@@ -759,6 +831,190 @@ class TestBugFixes(unittest.TestCase):
         attrs["id"] = "mutated"
         self.assertEqual(el.get_attribute("id"), "test")
 
+    def test_tag_fragment_cache_is_bounded(self):
+        """Tags seen after the tag cache is full still render, uncached."""
+        from nitro_ui.core import element
+
+        cached = dict(element._TAG_FRAGMENTS)
+        try:
+            element._TAG_FRAGMENTS.clear()
+            element._TAG_FRAGMENTS.update(
+                (f"x-filler-{i}", ("", "", ""))
+                for i in range(element._TAG_FRAGMENTS_MAX)
+            )
+            el = HTMLElement("hi", tag="x-uncached", id="a")
+            self.assertEqual(el.render(), '<x-uncached id="a">hi</x-uncached>')
+            self.assertEqual(
+                el.render(pretty=True), '<x-uncached id="a">hi</x-uncached>\n'
+            )
+            self.assertNotIn("x-uncached", element._TAG_FRAGMENTS)
+            self.assertEqual(len(element._TAG_FRAGMENTS), element._TAG_FRAGMENTS_MAX)
+        finally:
+            element._TAG_FRAGMENTS.clear()
+            element._TAG_FRAGMENTS.update(cached)
+
+    def test_attribute_fragment_cache_recovers_when_full(self):
+        """A full attribute cache is reset so new hot pairs are cached."""
+        from nitro_ui.core import element
+
+        cached = dict(element._ATTR_FRAGMENTS)
+        try:
+            element._ATTR_FRAGMENTS.clear()
+            element._ATTR_FRAGMENTS.update(
+                (("id", f"row-{i}"), f' id="row-{i}"')
+                for i in range(element._ATTR_FRAGMENTS_MAX)
+            )
+            el = HTMLElement(tag="div", class_name="btn")
+            self.assertEqual(el.render(), '<div class="btn"></div>')
+            self.assertEqual(
+                element._ATTR_FRAGMENTS, {("class_name", "btn"): ' class="btn"'}
+            )
+            self.assertEqual(el.render(), '<div class="btn"></div>')
+        finally:
+            element._ATTR_FRAGMENTS.clear()
+            element._ATTR_FRAGMENTS.update(cached)
+
+
+class TestFreeze(unittest.TestCase):
+    """Opt-in render caching via freeze()."""
+
+    def test_freeze_returns_cached_output(self):
+        el = Div(Span("cached"), class_name="box").freeze()
+        first = el.render()
+        self.assertEqual(first, '<div class="box"><span>cached</span></div>')
+        self.assertIs(el.render(), first)
+        self.assertTrue(el.frozen)
+
+    def test_freeze_caches_pretty_separately(self):
+        el = Div(Span("x")).freeze()
+        self.assertEqual(el.render(), "<div><span>x</span></div>")
+        self.assertEqual(el.render(pretty=True), "<div>\n  <span>x</span>\n</div>\n")
+
+    def test_mutation_invalidates_cache(self):
+        el = Div("a").freeze()
+        self.assertEqual(el.render(), "<div>a</div>")
+        el.append(Span("b"))
+        self.assertEqual(el.render(), "<div>a<span>b</span></div>")
+        el.add_attribute("id", "main")
+        self.assertEqual(el.render(), '<div id="main">a<span>b</span></div>')
+        el.add_style("color", "red")
+        self.assertIn('style="color: red"', el.render())
+        el.text = "c"
+        self.assertTrue(el.render().startswith('<div id="main" style="color: red">c'))
+
+    def test_hooks_skipped_on_cache_hit(self):
+        calls = []
+
+        class Tracked(HTMLElement):
+            def on_before_render(self):
+                calls.append(1)
+
+        el = Tracked(tag="div").freeze()
+        el.render()
+        el.render()
+        self.assertEqual(len(calls), 1)
+
+    def test_unfreeze(self):
+        child = Span("x")
+        el = Div(child).freeze()
+        el.render()
+        child.text = "y"
+        self.assertEqual(el.render(), "<div><span>x</span></div>")
+        el.unfreeze()
+        self.assertFalse(el.frozen)
+        self.assertEqual(el.render(), "<div><span>y</span></div>")
+
+
+class TestRenderOverrides(unittest.TestCase):
+    """Subclasses overriding render() still compose inside parents."""
+
+    def test_render_override_used_as_child(self):
+        el = Div(Upper("hi", tag="span"), Span("lo"))
+        self.assertEqual(el.render(), "<div><SPAN>HI</SPAN><span>lo</span></div>")
+        self.assertEqual(
+            el.render(pretty=True),
+            "<div>\n  <SPAN>HI</SPAN>\n  <span>lo</span>\n</div>\n",
+        )
+
+
+class TestRenderTo(unittest.TestCase):
+    """Streaming output via render_to()."""
+
+    def test_matches_render(self):
+        """Streamed output is identical to render() in both modes."""
+        for pretty in (False, True):
+            tree = streaming_tree()
+            out = io.StringIO()
+            tree.render_to(out, pretty=pretty)
+            self.assertEqual(out.getvalue(), tree.render(pretty=pretty))
+
+    def test_writes_fragments_incrementally(self):
+        """The document is written in pieces, not as one joined string."""
+        chunks = []
+
+        class Sink:
+            write = chunks.append
+
+        tree = streaming_tree()
+        tree.render_to(Sink())
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual("".join(chunks), tree.render())
+
+    def test_frozen_cache_filled_while_streaming(self):
+        """A frozen subtree streamed once is served from its cache after."""
+        frozen = Div(Span("x")).freeze()
+        frozen.render_to(io.StringIO())
+        self.assertEqual(
+            frozen._render_cache, {(False, 0): "<div><span>x</span></div>"}
+        )
+
+    def test_render_override_at_top_level(self):
+        out = io.StringIO()
+        Upper("hi", tag="span").render_to(out)
+        self.assertEqual(out.getvalue(), "<SPAN>HI</SPAN>")
+
+
+class TestRenderIter(unittest.TestCase):
+    """Chunked output via render_iter()."""
+
+    def test_matches_render(self):
+        """Joined chunks are identical to render() in both modes."""
+        for pretty in (False, True):
+            for chunk_size in (1, 20, 8192):
+                tree = streaming_tree()
+                self.assertEqual(
+                    "".join(tree.render_iter(pretty=pretty, chunk_size=chunk_size)),
+                    tree.render(pretty=pretty),
+                )
+
+    def test_chunk_size(self):
+        """Every chunk but the last reaches chunk_size."""
+        chunks = list(streaming_tree().render_iter(chunk_size=20))
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks[:-1]:
+            self.assertGreaterEqual(len(chunk), 20)
+
+    def test_yields_before_later_children_render(self):
+        """The first chunk is produced before later siblings are serialized."""
+        rendered = []
+
+        class Tracked(HTMLElement):
+            def on_before_render(self):
+                rendered.append(self.text)
+
+        tree = Div(*[Tracked(str(i), tag="p") for i in range(10)])
+        chunks = tree.render_iter(chunk_size=1)
+        self.assertEqual(next(chunks), "<div><p>0</p>")
+        self.assertEqual(rendered, ["0"])
+        self.assertEqual(
+            "".join(chunks), "".join(f"<p>{i}</p>" for i in range(1, 10)) + "</div>"
+        )
+
+    def test_render_override_at_top_level(self):
+        self.assertEqual(
+            list(Upper("hi", tag="span").render_iter()), ["<SPAN>HI</SPAN>"]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
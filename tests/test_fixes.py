@@ -280,6 +280,30 @@ class TestAttributeKeyValidation(unittest.TestCase):
             self.assertTrue(len(w) > 0)
             self.assertNotIn("script", rendered)
 
+    def test_invalid_attribute_key_warns_on_every_render(self):
+        """Invalid keys are rejected again on re-render, not cached as valid."""
+        div = Div("test", id="main")
+        div._attributes["bad key"] = "val"
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            first = str(div)
+            second = str(div)
+        self.assertEqual(len(w), 2)
+        self.assertEqual(w[0].filename, __file__)
+        self.assertEqual(first, second)
+        self.assertEqual(first, '<div id="main">test</div>')
+
+    def test_invalid_attribute_key_warning_points_at_caller_when_nested(self):
+        """The warning is attributed to the render() call, not library code."""
+        child = Div("inner")
+        child._attributes["bad key"] = "val"
+        parent = Div(Div(child))
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            parent.render(pretty=True)
+        self.assertEqual(len(w), 1)
+        self.assertEqual(w[0].filename, __file__)
+
 
 class TestParserFixes(unittest.TestCase):
     """Fix #11/#12/#13: Parser text handling improvements."""
@@ -0,0 +1,76 @@
+import unittest
+
+from nitro_ui import memoize
+from nitro_ui.tags.layout import Div
+from nitro_ui.tags.text import H3, Paragraph
+
+
+class TestMemoize(unittest.TestCase):
+
+    def test_same_arguments_reuse_element(self):
+        """Identical arguments return the cached, frozen element."""
+        calls = []
+
+        @memoize(maxsize=8)
+        def card(title, body):
+            calls.append(title)
+            return Div(H3(title), Paragraph(body), class_name="card")
+
+        first = card("Hello", "World")
+        second = card("Hello", "World")
+        self.assertIs(first, second)
+        self.assertTrue(first.frozen)
+        self.assertEqual(calls, ["Hello"])
+        self.assertEqual(
+            first.render(),
+            '<div class="card"><h3>Hello</h3><p>World</p></div>',
+        )
+
+    def test_different_arguments_build_new_element(self):
+        """A new argument tuple calls the factory again."""
+
+        @memoize
+        def card(title):
+            return Div(H3(title))
+
+        self.assertIsNot(card("A"), card("B"))
+        self.assertEqual(card("B").render(), "<div><h3>B</h3></div>")
+        self.assertEqual(card.cache_info().misses, 2)
+
+    def test_output_matches_unmemoized_render(self):
+        """Cached elements render identically in compact and pretty mode."""
+
+        def build(title):
+            return Div(H3(title), Paragraph("text"))
+
+        cached = memoize()(build)
+        parent = Div(cached("x"), cached("x"))
+        expected = Div(build("x"), build("x"))
+        self.assertEqual(parent.render(), expected.render())
+        self.assertEqual(parent.render(pretty=True), expected.render(pretty=True))
+
+    def test_cache_clear(self):
+        """cache_clear() forces the factory to run again."""
+
+        @memoize()
+        def card(title):
+            return Div(title)
+
+        first = card("a")
+        card.cache_clear()
+        self.assertIsNot(card("a"), first)
+
+    def test_preserves_function_metadata(self):
+        """The wrapper keeps the factory's name and docstring."""
+
+        @memoize(maxsize=4)
+        def card():
+            """Render a card."""
+            return Div()
+
+        self.assertEqual(card.__name__, "card")
+        self.assertEqual(card.__doc__, "Render a card.")
+
+
+if __name__ == "__main__":
+    unittest.main()